@@ -3,6 +3,12 @@ from praw.models.reddit.comment import Comment
 from rue import nlp
 from rue.config import cfg
 from rue.logger import logger
+from rue.screens import (
+    doc_has_datetime,
+    doc_has_first_person,
+    screen_datetime,
+    screen_first_person,
+)
 from rue.utils import sanitize
 
 
@@ -16,24 +22,15 @@ def calculate_similarity(asked_title: str, googled_title: str) -> float:
 
 
 def contains_datetime(comment: Comment) -> bool:
-    return any(token.ent_type_ in ("DATE", "TIME") for token in nlp(comment.body))
+    if (verdict := screen_datetime(comment.body)) is not None:
+        return verdict
+    return doc_has_datetime(nlp(comment.body))
 
 
 def contains_first_person(comment: Comment) -> bool:
-    fp = (
-        "i",
-        "me",
-        "my",
-        "mine",
-        "we",
-        "us",
-        "our",
-        "ours",
-        "myself",
-        "ourselves",
-    )
-    doc = nlp(comment.body)
-    return any(token.lemma_.lower() in fp for token in doc if token.pos_ == "PRON")
+    if (verdict := screen_first_person(comment.body)) is not None:
+        return verdict
+    return doc_has_first_person(nlp(comment.body))
 
 
 def contains_banned_words(comment: Comment) -> str:
@@ -0,0 +1,441 @@
+import re
+from typing import Optional
+
+from spacy.attrs import NORM, ORTH
+from spacy.lang.en import English
+from spacy.tokens import Doc
+
+_WORD = re.compile(r"[a-z]+")
+_CONTRACTION = re.compile(r"[a-z]+(?:['’][a-z]+)+")
+
+# words that can appear inside a DATE or TIME entity. a body without any of these
+# and without digits gets no such entity from the NER, so it is rejected unparsed.
+# tests/test_screens.py checks this against the entities found in the fixture corpus
+TEMPORAL_WORDS = frozenset(
+    (
+        "second",
+        "seconds",
+        "sec",
+        "secs",
+        "minute",
+        "minutes",
+        "min",
+        "mins",
+        "hour",
+        "hours",
+        "hourly",
+        "hr",
+        "hrs",
+        "day",
+        "days",
+        "daily",
+        "everyday",
+        "daytime",
+        "daylight",
+        "midday",
+        "weekday",
+        "weekdays",
+        "weeknight",
+        "weeknights",
+        "week",
+        "weeks",
+        "weekly",
+        "biweekly",
+        "weekend",
+        "weekends",
+        "fortnight",
+        "fortnightly",
+        "month",
+        "months",
+        "monthly",
+        "quarter",
+        "quarters",
+        "quarterly",
+        "year",
+        "years",
+        "yearly",
+        "yr",
+        "yrs",
+        "annual",
+        "annually",
+        "semiannual",
+        "decade",
+        "decades",
+        "century",
+        "centuries",
+        "centennial",
+        "bicentennial",
+        "millennium",
+        "millennia",
+        "generation",
+        "generations",
+        "morning",
+        "mornings",
+        "morn",
+        "afternoon",
+        "afternoons",
+        "arvo",
+        "evening",
+        "evenings",
+        "night",
+        "nights",
+        "nightly",
+        "nite",
+        "nighttime",
+        "overnight",
+        "tonight",
+        "tonite",
+        "noon",
+        "midnight",
+        "dawn",
+        "dusk",
+        "sunrise",
+        "sunset",
+        "sundown",
+        "sunup",
+        "lunchtime",
+        "dinnertime",
+        "bedtime",
+        "today",
+        "tomorrow",
+        "tomorow",
+        "tmrw",
+        "tmr",
+        "tmw",
+        "yesterday",
+        "now",
+        "ago",
+        "clock",
+        "am",
+        "pm",
+        "time",
+        "times",
+        "spring",
+        "springs",
+        "springtime",
+        "summer",
+        "summers",
+        "summertime",
+        "fall",
+        "falls",
+        "autumn",
+        "autumns",
+        "winter",
+        "winters",
+        "wintertime",
+        "season",
+        "seasons",
+        "semester",
+        "semesters",
+        "trimester",
+        "term",
+        "terms",
+        "christmas",
+        "xmas",
+        "easter",
+        "halloween",
+        "thanksgiving",
+        "hanukkah",
+        "chanukah",
+        "ramadan",
+        "passover",
+        "diwali",
+        "kwanzaa",
+        "eid",
+        "valentine",
+        "valentines",
+        "nye",
+        "eve",
+        "holiday",
+        "holidays",
+        "birthday",
+        "birthdays",
+        "anniversary",
+        "era",
+        "eras",
+        "age",
+        "ages",
+        "teen",
+        "teens",
+        "teenage",
+        "twenties",
+        "thirties",
+        "forties",
+        "fifties",
+        "sixties",
+        "seventies",
+        "eighties",
+        "nineties",
+        "recent",
+        "recently",
+        "lately",
+        "nowadays",
+        "currently",
+        "later",
+        "earlier",
+        "soon",
+        "early",
+        "late",
+        "past",
+        "future",
+        "forever",
+        "yesteryear",
+        "monday",
+        "tuesday",
+        "wednesday",
+        "thursday",
+        "friday",
+        "saturday",
+        "sunday",
+        "mondays",
+        "tuesdays",
+        "wednesdays",
+        "thursdays",
+        "fridays",
+        "saturdays",
+        "sundays",
+        "mon",
+        "tue",
+        "tues",
+        "wed",
+        "thu",
+        "thur",
+        "thurs",
+        "fri",
+        "sat",
+        "sun",
+        "january",
+        "february",
+        "march",
+        "april",
+        "may",
+        "june",
+        "july",
+        "august",
+        "september",
+        "october",
+        "november",
+        "december",
+        "jan",
+        "feb",
+        "mar",
+        "apr",
+        "jun",
+        "jul",
+        "aug",
+        "sep",
+        "sept",
+        "oct",
+        "nov",
+        "dec",
+        "one",
+        "two",
+        "three",
+        "four",
+        "five",
+        "six",
+        "seven",
+        "eight",
+        "nine",
+        "ten",
+        "eleven",
+        "twelve",
+        "thirteen",
+        "fourteen",
+        "fifteen",
+        "sixteen",
+        "seventeen",
+        "eighteen",
+        "nineteen",
+        "twenty",
+        "thirty",
+        "forty",
+        "fifty",
+        "sixty",
+        "seventy",
+        "eighty",
+        "ninety",
+        "hundred",
+        "hundreds",
+        "thousand",
+        "dozen",
+        "dozens",
+        "few",
+        "several",
+        "couple",
+        "half",
+        "first",
+        "third",
+        "fourth",
+        "fifth",
+        "sixth",
+        "seventh",
+        "eighth",
+        "ninth",
+        "tenth",
+        "eleventh",
+        "twelfth",
+        "thirteenth",
+        "fourteenth",
+        "fifteenth",
+        "sixteenth",
+        "seventeenth",
+        "eighteenth",
+        "nineteenth",
+        "twentieth",
+        "thirtieth",
+        "last",
+        "next",
+        "previous",
+        "todays",
+        "tomorrows",
+        "yesterdays",
+        "tonights",
+        "lifetime",
+        "lifetimes",
+        "bday",
+        "bdays",
+        "noonish",
+        "oclock",
+        "someday",
+        "anytime",
+        "daybreak",
+        "nightfall",
+        "twilight",
+        "solstice",
+        "equinox",
+        "weds",
+        "wk",
+        "wks",
+        "mo",
+        "mos",
+        "christmastime",
+        "lent",
+        "advent",
+        "pentecost",
+        "sabbath",
+        "shabbat",
+        "epiphany",
+        "purim",
+        "yom",
+        "kippur",
+        "hanukah",
+        "cambrian",
+        "ordovician",
+        "silurian",
+        "devonian",
+        "carboniferous",
+        "permian",
+        "triassic",
+        "jurassic",
+        "cretaceous",
+        "paleogene",
+        "neogene",
+        "quaternary",
+        "precambrian",
+        "paleozoic",
+        "mesozoic",
+        "cenozoic",
+        "paleocene",
+        "eocene",
+        "oligocene",
+        "miocene",
+        "pliocene",
+        "pleistocene",
+        "holocene",
+    )
+)
+
+# surface patterns the NER reads as DATE or TIME. kept narrow on purpose: clock
+# times, weekdays, "<word> ago", "today" ("usa today") and a spaced "am" ("12 am
+# I right") also show up outside dates, so those are left to the NER
+_DEFINITE_DATETIME = re.compile(
+    r"""
+    \b(?:tonight|tomorrow|yesterday)\b
+    | \b\d{1,2}(?:am|pm)\b
+    | \b\d{1,2}\s?(?:a\.m\.|p\.m\.)
+    | \b\d{1,2}\s+pm\b
+    | \b(?:\d+|(?i:one|two|three|four|five|six|seven|eight|nine|ten|few|several))
+      \s+(?:seconds|minutes|hours|days|weeks|months|years|decades)\b
+    | \b(?i:last|next|this)\s+(?:week|weekend|month|year|decade|night|morning)\b
+    """,
+    re.VERBOSE,
+)
+
+FIRST_PERSON = (
+    "i",
+    "me",
+    "my",
+    "mine",
+    "we",
+    "us",
+    "our",
+    "ours",
+    "myself",
+    "ourselves",
+)
+
+# tokenizer exceptions that split off a first person piece, e.g. "im" -> "i" + "m",
+# "wed" -> "we" + "d" and "let's" -> "let" + "'s" (norm "us"). "lets", "lemme" and
+# "gimme" are not split but are still left to the tagger
+_FIRST_PERSON_WORDS = frozenset(
+    (
+        *FIRST_PERSON,
+        "lets",
+        "lemme",
+        "gimme",
+        *(
+            string.lower()
+            for string, pieces in English.Defaults.tokenizer_exceptions.items()
+            if any(
+                piece[ORTH].lower() in FIRST_PERSON
+                or piece.get(NORM, "").lower() in FIRST_PERSON
+                for piece in pieces
+            )
+        ),
+    )
+)
+
+# lowercase or title case only: "ME", "WE", "US" are as likely acronyms. "Me" and
+# "Us" are left out ("Portland, Me."), and so is anything glued to "-" or "." by a
+# word character ("us-east-1"). "I", "mine" and a trailing "my" ("oh my!") are
+# left to the tagger as well
+_DEFINITE_FIRST_PERSON = re.compile(
+    r"""
+    \b(?:[Ww]e|me|us|[Oo]urs?|[Mm]yself|[Oo]urselves)\b(?![-.]\w)
+    | \b[Mm]y\s+\w
+    | \bI(?:'|’)(?:m|ve|d|ll)\b
+    """,
+    re.VERBOSE,
+)
+
+
+def screen_datetime(body: str) -> Optional[bool]:
+    if not any(char.isdigit() for char in body) and TEMPORAL_WORDS.isdisjoint(
+        _WORD.findall(body.lower())
+    ):
+        return False
+    if _DEFINITE_DATETIME.search(body):
+        return True
+    return None
+
+
+def screen_first_person(body: str) -> Optional[bool]:
+    lowered = body.lower()
+    if _FIRST_PERSON_WORDS.isdisjoint(
+        (*_WORD.findall(lowered), *_CONTRACTION.findall(lowered))
+    ):
+        return False
+    if _DEFINITE_FIRST_PERSON.search(body):
+        return True
+    return None
+
+
+def doc_has_datetime(doc: Doc) -> bool:
+    return any(token.ent_type_ in ("DATE", "TIME") for token in doc)
+
+
+def doc_has_first_person(doc: Doc) -> bool:
+    return any(
+        token.lemma_.lower() in FIRST_PERSON for token in doc if token.pos_ == "PRON"
+    )
@@ -0,0 +1,27 @@
+"""Stand-ins for the parts of `rue` that need the spaCy model, secrets or a database.
+
+`rue/__init__` loads the model and logs into reddit, `rue.config` reads
+`.rue.secrets` and `rue.logger` connects to postgres. The tests register light
+modules under those names and import everything else from the package as is.
+Tests that need the model patch `rue.langproc.nlp` themselves.
+"""
+
+import logging
+import sys
+from pathlib import Path
+from types import ModuleType, SimpleNamespace
+
+
+def _stub(name: str, **attrs) -> ModuleType:
+    module = ModuleType(name)
+    module.__dict__.update(attrs)
+    sys.modules[name] = module
+    return module
+
+
+_package = _stub("rue", __path__=[str(Path(__file__).resolve().parents[1] / "rue")])
+_package.nlp = None
+_package.config = _stub(
+    "rue.config", cfg=SimpleNamespace(banned_words=()), secrets=SimpleNamespace()
+)
+_package.logger = _stub("rue.logger", logger=logging.getLogger("rue"))
@@ -0,0 +1,80 @@
+from types import SimpleNamespace
+
+import pytest
+
+from rue import langproc
+
+
+def comment(body: str) -> SimpleNamespace:
+    return SimpleNamespace(body=body)
+
+
+def token(ent_type_: str = "", pos_: str = "", lemma_: str = "") -> SimpleNamespace:
+    return SimpleNamespace(ent_type_=ent_type_, pos_=pos_, lemma_=lemma_)
+
+
+@pytest.fixture
+def parsed(monkeypatch):
+    """Replaces the model with a lookup of canned docs, recording parsed bodies."""
+    docs, calls = {}, []
+
+    def nlp(body: str) -> list:
+        calls.append(body)
+        return docs[body]
+
+    monkeypatch.setattr(langproc, "nlp", nlp)
+    return SimpleNamespace(docs=docs, calls=calls)
+
+
+@pytest.mark.parametrize(
+    "body, expected",
+    [
+        ("Cheese. The answer is always cheese.", False),
+        ("we went there yesterday and it was packed", True),
+        ("It took 20 minutes to get a table.", True),
+    ],
+)
+def test_datetime_decided_without_parsing(parsed, body, expected):
+    assert langproc.contains_datetime(comment(body)) is expected
+    assert not parsed.calls
+
+
+@pytest.mark.parametrize(
+    "body, doc, expected",
+    [
+        ("Read it on USA Today", [token(), token(), token("ORG"), token("ORG")], False),
+        ("during Lent", [token(), token("DATE")], True),
+        ("Wake up at 6:30", [token(), token(), token(), token("TIME")], True),
+    ],
+)
+def test_datetime_ambiguous_goes_to_ner(parsed, body, doc, expected):
+    parsed.docs[body] = doc
+    assert langproc.contains_datetime(comment(body)) is expected
+    assert parsed.calls == [body]
+
+
+@pytest.mark.parametrize(
+    "body, expected",
+    [
+        ("Ask your doctor, not strangers online.", False),
+        ("We need better public libraries.", True),
+        ("I'm not sure that is legal.", True),
+    ],
+)
+def test_first_person_decided_without_parsing(parsed, body, expected):
+    assert langproc.contains_first_person(comment(body)) is expected
+    assert not parsed.calls
+
+
+@pytest.mark.parametrize(
+    "body, doc, expected",
+    [
+        ("Let's go", [token(pos_="VERB", lemma_="let"), token("", "PRON", "us")], True),
+        ("ME is real", [token(pos_="PROPN", lemma_="ME"), token(), token()], False),
+        ("I think", [token(pos_="PRON", lemma_="I"), token(pos_="VERB")], True),
+    ],
+)
+def test_first_person_ambiguous_goes_to_tagger(parsed, body, doc, expected):
+    parsed.docs[body] = doc
+    assert langproc.contains_first_person(comment(body)) is expected
+    assert parsed.calls == [body]
@@ -0,0 +1,154 @@
+"""Checks the rule based pre-screens in rue/screens.py against the full pipeline.
+
+With en_core_web_md installed, the accuracy report over
+tests/fixtures/comments.jsonl is printed by
+
+    python -m pytest tests/test_screens.py -s -k pipeline
+
+and RUE_UPDATE_FIXTURES=1 rewrites the fixture verdicts from the model first.
+"""
+
+import json
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+import spacy
+
+from rue import langproc, screens
+
+CORPUS = Path(__file__).resolve().parent / "fixtures" / "comments.jsonl"
+MODEL = "en_core_web_md"
+
+CHECKS = {
+    "datetime": (
+        screens.screen_datetime,
+        langproc.contains_datetime,
+        screens.doc_has_datetime,
+    ),
+    "first_person": (
+        screens.screen_first_person,
+        langproc.contains_first_person,
+        screens.doc_has_first_person,
+    ),
+}
+
+
+def load_corpus() -> list[dict]:
+    with open(CORPUS) as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+@pytest.fixture(scope="module")
+def model():
+    if not spacy.util.is_package(MODEL):
+        pytest.skip(f"spaCy model {MODEL!r} is not installed")
+    return spacy.load(MODEL)
+
+
+@pytest.mark.parametrize(
+    "body, expected",
+    [
+        ("Whose picture is in your wallet?", False),
+        ("I'll be there overnight", None),
+        ("Every weekday he calls", None),
+        ("Happy Hanukkah everyone", None),
+        ("at sunset", None),
+        ("todays episode was great", None),
+        ("tomorrows weather looks bad", None),
+        ("not in my lifetime", None),
+        ("during Lent", None),
+        ("the Jurassic period", None),
+        ("Ran from 1500 feet up", None),
+        ("He got in 1999 votes", None),
+        ("from 2000 to 3000 dollars", None),
+        ("see John 3:16", None),
+        ("Santiago ago", None),
+        ("Read it on USA Today", None),
+        ("read it on usa today", None),
+        ("the Sunday Times said", None),
+        ("I was 12 am I right", None),
+        ("we went there yesterday", True),
+        ("closes at 5 pm", True),
+        ("up at 6am", True),
+        ("three years ago", True),
+        ("Last week my boss quit", True),
+    ],
+)
+def test_screen_datetime(body, expected):
+    assert screens.screen_datetime(body) is expected
+
+
+@pytest.mark.parametrize(
+    "body, expected",
+    [
+        ("The cat sat on the mat", False),
+        ("Imagine that", False),
+        ("idk", False),
+        ("I'm tired", True),
+        ("my dog", True),
+        ("We need libraries", True),
+        ("helped us a lot", True),
+        ("ME is a real disease", None),
+        ("WE ARE THE CHAMPIONS", None),
+        ("the US is big", None),
+        ("Portland, Me.", None),
+        ("deploy to us-east-1", None),
+        ("Oh my!", None),
+        ("coal mine", None),
+        ("I think", None),
+        ("Let's go to the beach", None),
+        ("Let’s go to the beach", None),
+        ("lets see", None),
+        ("lemme see", None),
+        ("gimme that", None),
+        ("wed be fine", None),
+    ],
+)
+def test_screen_first_person(body, expected):
+    assert screens.screen_first_person(body) is expected
+
+
+@pytest.mark.parametrize("check", CHECKS)
+def test_definite_verdicts_match_fixture(check):
+    screen, _, _ = CHECKS[check]
+    wrong = [
+        row["body"]
+        for row in load_corpus()
+        if (verdict := screen(row["body"])) is not None and verdict != row[check]
+    ]
+    assert not wrong
+
+
+def test_cascade_agrees_with_pipeline(model, monkeypatch):
+    monkeypatch.setattr(langproc, "nlp", model)
+    corpus = load_corpus()
+    disagreements = []
+    for check, (screen, contains, full) in CHECKS.items():
+        decided = agreed = 0
+        for row in corpus:
+            baseline = full(model(row["body"]))
+            if screen(row["body"]) is not None:
+                decided += 1
+                agreed += contains(SimpleNamespace(body=row["body"])) == baseline
+            if contains(SimpleNamespace(body=row["body"])) != baseline:
+                disagreements.append((check, row["body"]))
+            row[check] = baseline
+        print(f"{check}: screen decided {decided}/{len(corpus)}, agreed {agreed}")
+    if os.environ.get("RUE_UPDATE_FIXTURES"):
+        with open(CORPUS, "w") as file:
+            file.writelines(json.dumps(row) + "\n" for row in corpus)
+    assert not disagreements
+
+
+def test_temporal_words_cover_entities(model):
+    missing = {
+        token.lower_
+        for row in load_corpus()
+        for token in model(row["body"])
+        if token.ent_type_ in ("DATE", "TIME")
+        and token.is_alpha
+        and token.lower_ not in screens.TEMPORAL_WORDS
+    }
+    assert not missing